@@ -4,20 +4,219 @@ Google Cloud Storage Utilities for Music Streaming
 
 import os
 import json
+import mmap
+import tempfile
+import atexit
+import functools
+import asyncio
 import logging
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
 from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for V4 URL signing, so signing never runs on the event loop. google-auth signs
+# with the cryptography (OpenSSL) backend when installed (see requirements.txt); its pure-Python
+# rsa fallback is several times slower and holds the GIL, so workers would only take turns
+SIGNING_MAX_WORKERS = 16
+_signing_executor = ThreadPoolExecutor(max_workers=SIGNING_MAX_WORKERS, thread_name_prefix='gcs-sign')
+
+# HTTP connection pool sized to match the signing/listing concurrency
+HTTP_POOL_SIZE = SIGNING_MAX_WORKERS
+
+# Minimum seconds between cache rewrites triggered by uploads/deletes
+CACHE_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Every case variant of the MP3 extension, for a C-level str.endswith(tuple) check
+_MP3_SUFFIXES = ('.mp3', '.MP3', '.Mp3', '.mP3')
+
+# Listing page size and the only blob fields the listing needs
+LIST_PAGE_SIZE = 1000
+LIST_FIELDS = 'items(name),nextPageToken'
+
+# Concurrent per-folder listings (each is an I/O-bound LIST RPC)
+LIST_MAX_WORKERS = 12
+
+# Process umask, read once at import (os.umask can only be read by setting it, which races threads)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def create_http_session(credentials):
+    """
+    Create an authorized HTTP session with a larger keep-alive connection pool
+
+    The session is passed to storage.Client as _http, which skips the client's
+    own scoping, so the storage scopes are applied here; an unscoped service
+    account token grant is rejected with invalid_scope.
+
+    Args:
+        credentials: Service account credentials
+
+    Returns:
+        AuthorizedSession with a pooled, retrying HTTPS adapter
+    """
+    session = AuthorizedSession(credentials.with_scopes(storage.Client.SCOPE))
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        # Return the last response when retries run out so google-cloud maps the HTTP status itself
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 503], raise_on_status=False)
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+@functools.cache
+def load_credentials(credentials_path):
+    """
+    Parse a service account key file once per process
+
+    Args:
+        credentials_path: Path to service account key JSON file
+
+    Returns:
+        Service account credentials
+    """
+    return service_account.Credentials.from_service_account_file(credentials_path)
+
+
+@functools.cache
+def get_shared_client(credentials_path):
+    """
+    Storage client shared by every user of the same key file in this process
+
+    Built on a pooled keep-alive session, so the key is parsed and the OAuth
+    token fetched once rather than per client.
+
+    Args:
+        credentials_path: Path to service account key JSON file
+
+    Returns:
+        google.cloud.storage.Client
+    """
+    credentials = load_credentials(credentials_path)
+    return storage.Client(credentials=credentials, _http=create_http_session(credentials))
+
+
+def list_mp3_files(bucket, prefix=None):
+    """
+    List MP3 blob names page by page, fetching only the name field
+
+    Args:
+        bucket: GCS bucket
+        prefix: Server-side name prefix (e.g., 'Fantasy_mp3/'); None lists the whole bucket
+
+    Returns:
+        List of MP3 blob names
+    """
+    blobs = bucket.client.list_blobs(
+        bucket, prefix=prefix, fields=LIST_FIELDS, page_size=LIST_PAGE_SIZE
+    )
+
+    return [
+        blob.name
+        for page in blobs.pages
+        for blob in page
+        if blob.name.endswith(_MP3_SUFFIXES)
+    ]
+
+
+def load_file_list(path):
+    """
+    Load a cached file list from disk
+
+    Args:
+        path: Path to cached file list JSON
+
+    Returns:
+        Tuple of (list of blob names, fetch timestamp)
+    """
+    with open(path, 'rb') as f:
+        if not orjson:
+            payload = json.loads(f.read())
+        else:
+            # Parse straight from the mapped pages instead of copying the file into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    payload = orjson.loads(view)
+
+    # Older caches are a bare list; fall back to the file's modification time
+    if isinstance(payload, list):
+        return payload, os.path.getmtime(path)
+    return payload['files'], payload['fetched_at']
+
+
+def file_mode_for(path):
+    """
+    Permission bits a file written at path should get
+
+    mkstemp creates 0600 files and os.replace keeps that mode, so atomic
+    writes chmod the temp file to this before swapping it in.
+
+    Args:
+        path: File that is about to be replaced
+
+    Returns:
+        The existing file's mode, or 0o666 minus the umask for a new file
+    """
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def save_file_list(files, path, fetched_at=None):
+    """
+    Save a file list to disk as compact JSON, replacing the file atomically
+
+    Args:
+        files: List of blob names
+        path: Path to cached file list JSON
+        fetched_at: When the list was fetched from GCS (defaults to now)
+    """
+    payload = {
+        'fetched_at': fetched_at if fetched_at is not None else time.time(),
+        'files': files
+    }
+    if orjson:
+        data = orjson.dumps(payload)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    # Write to a uniquely named temp file and swap it in, so readers never see a truncated
+    # cache and concurrent writers (one per worker) never share a temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, file_mode_for(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 class GCSMusicManager:
     """
     Manages music file operations with Google Cloud Storage
     """
 
-    def __init__(self, bucket_name=None, credentials_path=None, cache_file='gcs_music_files.json'):
+    def __init__(self, bucket_name=None, credentials_path=None, cache_file='gcs_music_files.json',
+                 folders=None, ttl_seconds=3600, refresh_after_reads=None):
         """
         Initialize GCS Music Manager
 
@@ -25,19 +224,82 @@ class GCSMusicManager:
             bucket_name: GCS bucket name
             credentials_path: Path to service account key JSON file
             cache_file: Path to cached file list JSON
+            folders: Music folders to list (e.g., ['Fantasy_mp3']); None lists the whole bucket
+            ttl_seconds: Age after which the file list is refreshed in the background (None disables)
+            refresh_after_reads: Also refresh after this many folder lookups (None disables)
         """
         self.bucket_name = bucket_name
         self.credentials_path = credentials_path
         self.cache_file = cache_file
-        self.storage_client = None
-        self.bucket = None
-        self.all_files = []
+        self.folders = list(folders) if folders else None
+        self.ttl_seconds = ttl_seconds
+        self.refresh_after_reads = refresh_after_reads
+        self._storage_client = None
+        self._bucket = None
+        self._signing_credentials = None
+        self._files = []
+        self._files_set = set()
+        self._files_stale = False
+        self._cache_dirty = False
+        self._last_flush = 0.0
+        self._folder_index = {}
+        self._listed_folders = set()
+        self._blobs = {}  # {blob_name: Blob} reused for URL signing
+
+        # Bumped whenever the set of files changes, so callers can skip rebuilding derived tables
+        self.generation = 0
+
+        # Freshness tracking for stale-while-revalidate refreshes
+        self._fetched_at = 0.0
+        self._refresh_checked_at = 0.0
+        self._reads = 0
+        self._refresh_thread = None
+
+        # GCS client and file list are initialized on first use
+        self._client_ready = False
+        self._files_ready = False
+        self._init_lock = threading.RLock()
+
+        # Persist changes still pending from coalesced writes on interpreter exit
+        atexit.register(self.flush)
+
+    def _ensure_client(self):
+        """
+        Initialize the GCS client once, on first access
+        """
+        if self._client_ready:
+            return
+        with self._init_lock:
+            if not self._client_ready:
+                self._init_gcs_client()
+                self._client_ready = True
+
+    def _ensure_files(self):
+        """
+        Load the file list once, on first access
+        """
+        if self._files_ready:
+            return
+        with self._init_lock:
+            if not self._files_ready:
+                self._load_file_list()
+                self._files_ready = True
 
-        # Initialize GCS client
-        self._init_gcs_client()
+    @property
+    def storage_client(self):
+        """
+        GCS storage client (initialized lazily)
+        """
+        self._ensure_client()
+        return self._storage_client
 
-        # Load file list (from cache or GCS)
-        self._load_file_list()
+    @property
+    def bucket(self):
+        """
+        GCS bucket handle (initialized lazily)
+        """
+        self._ensure_client()
+        return self._bucket
 
     def _init_gcs_client(self):
         """
@@ -48,21 +310,43 @@ class GCSMusicManager:
                 logger.error(f"GCS credentials file not found: {self.credentials_path}")
                 return
 
-            # Create credentials from service account key
-            credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path
-            )
+            # Keep the parsed key so signing never re-reads the key file or falls back to ADC
+            self._signing_credentials = load_credentials(self.credentials_path)
 
-            # Initialize storage client
-            self.storage_client = storage.Client(credentials=credentials)
-            self.bucket = self.storage_client.bucket(self.bucket_name)
+            # Shared storage client on a pooled keep-alive session
+            self._storage_client = get_shared_client(self.credentials_path)
+            self._bucket = self._storage_client.bucket(self.bucket_name)
 
             logger.info(f"GCS client initialized for bucket: {self.bucket_name}")
 
         except Exception as e:
             logger.error(f"Failed to initialize GCS client: {e}")
-            self.storage_client = None
-            self.bucket = None
+            self._storage_client = None
+            self._bucket = None
+            self._signing_credentials = None
+
+    @property
+    def all_files(self):
+        """
+        List of cached MP3 blob names (loaded lazily)
+        """
+        self._ensure_files()
+        return self._file_list()
+
+    @all_files.setter
+    def all_files(self, files):
+        self._files = list(files)
+        self._files_set = set(self._files)
+        self._files_stale = False
+
+    def _file_list(self):
+        """
+        Current file list, compacted lazily after deletions
+        """
+        if self._files_stale:
+            self._files = [f for f in self._files if f in self._files_set]
+            self._files_stale = False
+        return self._files
 
     def _load_file_list(self):
         """
@@ -71,9 +355,10 @@ class GCSMusicManager:
         # Try loading from cache first
         if os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self.all_files = json.load(f)
-                logger.info(f"Loaded {len(self.all_files)} files from cache: {self.cache_file}")
+                self.all_files, self._fetched_at = load_file_list(self.cache_file)
+                self._build_folder_index()
+                self._listed_folders = set(self._folder_index)
+                logger.info(f"Loaded {len(self._files)} files from cache: {self.cache_file}")
                 return
             except Exception as e:
                 logger.warning(f"Failed to load cache file: {e}")
@@ -81,40 +366,183 @@ class GCSMusicManager:
         # If cache not available, fetch from GCS
         self._refresh_file_list()
 
-    def _refresh_file_list(self):
+    def _list_folder(self, folder=None):
+        """
+        List MP3 files under a folder using a server-side prefix
+
+        Args:
+            folder: Folder name (e.g., 'Fantasy_mp3'); None lists the whole bucket
+
+        Returns:
+            List of MP3 blob names
+        """
+        prefix = folder + '/' if folder else None
+        return list_mp3_files(self.bucket, prefix)
+
+    def _list_folders(self, folders):
+        """
+        List several folders concurrently
+
+        Args:
+            folders: Folder names
+
+        Returns:
+            List of per-folder MP3 blob name lists, in input order
+        """
+        folders = list(folders)
+        if len(folders) <= 1:
+            return [self._list_folder(folder) for folder in folders]
+
+        with ThreadPoolExecutor(
+            max_workers=min(LIST_MAX_WORKERS, len(folders)), thread_name_prefix='gcs-list'
+        ) as executor:
+            return list(executor.map(self._list_folder, folders))
+
+    def _refresh_file_list(self, folders=None):
         """
         Fetch all MP3 files from GCS bucket and update cache
+
+        Args:
+            folders: Folders to list; defaults to the configured music folders
         """
         if not self.bucket:
             logger.error("GCS bucket not initialized, cannot refresh file list")
             return
 
+        folders = folders or self.folders
+
         try:
             logger.info(f"Fetching file list from GCS bucket: {self.bucket_name}")
-            blobs = self.bucket.list_blobs()
 
-            self.all_files = []
-            for blob in blobs:
-                # Only include MP3 files
-                if blob.name.lower().endswith('.mp3'):
-                    self.all_files.append(blob.name)
+            fetched_at = time.time()
 
-            logger.info(f"Fetched {len(self.all_files)} MP3 files from GCS")
+            if folders:
+                # One prefixed listing per music folder, run concurrently; unrelated objects never leave GCS
+                files = list(itertools.chain.from_iterable(self._list_folders(folders)))
+            else:
+                files = self._list_folder()
 
-            # Save to cache
-            self._save_cache()
+            self._fetched_at = fetched_at
+
+            changed = set(files) != self._files_set
+            if changed:
+                self.all_files = files
+                self._build_folder_index()
+                self.generation += 1
+            self._listed_folders = set(folders) if folders else set(self._folder_index)
+
+            logger.info(f"Fetched {len(files)} MP3 files from GCS")
+
+            # Save to cache; an unchanged listing leaves the file alone (every worker refreshes)
+            if changed or self._cache_dirty:
+                self._save_cache()
 
         except Exception as e:
             logger.error(f"Failed to refresh file list from GCS: {e}")
 
+    def _build_folder_index(self):
+        """
+        Build the {folder: [files]} index from the current file list
+        """
+        # Built aside and swapped in so concurrent readers never see a partial index
+        folder_index = {}
+        for file_path in self._file_list():
+            folder, sep, _ = file_path.partition('/')
+            if sep:
+                folder_index.setdefault(folder, []).append(file_path)
+        self._folder_index = folder_index
+
+    def _check_freshness(self):
+        """
+        Schedule a background refresh when the file list outlives its TTL or read budget
+        """
+        self._reads += 1
+        now = time.time()
+
+        expired = (
+            self.ttl_seconds is not None
+            and now - max(self._fetched_at, self._refresh_checked_at) > self.ttl_seconds
+        )
+        exhausted = self.refresh_after_reads is not None and self._reads >= self.refresh_after_reads
+
+        if expired or exhausted:
+            self._refresh_checked_at = now
+            self._reads = 0
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """
+        Refresh the file list on a background thread while the stale list keeps serving
+        """
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+
+        logger.info("File list is stale, refreshing from GCS in the background")
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_file_list, name='gcs-file-list-refresh', daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _add_file(self, file_path):
+        """
+        Add a file to the file list, membership set and folder index in O(1)
+
+        Returns:
+            True if the file was not already known
+        """
+        if file_path in self._files_set:
+            return False
+        self._file_list().append(file_path)
+        self._files_set.add(file_path)
+        self._index_file(file_path)
+        self.generation += 1
+        return True
+
+    def _remove_file(self, file_path):
+        """
+        Remove a file from the membership set and folder index; the list is compacted lazily
+
+        Returns:
+            True if the file was known
+        """
+        if file_path not in self._files_set:
+            return False
+        self._files_set.discard(file_path)
+        self._files_stale = True
+        self._unindex_file(file_path)
+        self._blobs.pop(file_path, None)
+        self.generation += 1
+        return True
+
+    def _index_file(self, file_path):
+        """
+        Add a single file to the folder index
+        """
+        folder, sep, _ = file_path.partition('/')
+        if sep:
+            self._folder_index.setdefault(folder, []).append(file_path)
+
+    def _unindex_file(self, file_path):
+        """
+        Remove a single file from the folder index
+        """
+        folder, sep, _ = file_path.partition('/')
+        files = self._folder_index.get(folder) if sep else None
+        if files and file_path in files:
+            files.remove(file_path)
+            if not files:
+                del self._folder_index[folder]
+
     def _save_cache(self):
         """
         Save file list to cache
         """
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.all_files, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved {len(self.all_files)} files to cache: {self.cache_file}")
+            files = self._file_list()
+            save_file_list(files, self.cache_file, self._fetched_at or None)
+            self._cache_dirty = False
+            self._last_flush = time.time()
+            logger.info(f"Saved {len(files)} files to cache: {self.cache_file}")
         except Exception as e:
             logger.error(f"Failed to save cache file: {e}")
 
@@ -128,18 +556,50 @@ class GCSMusicManager:
         Returns:
             List of file paths matching the folders
         """
-        matching_files = []
+        self._ensure_files()
+        self._check_freshness()
+        self._fetch_missing_folders(folder_list)
 
-        for file_path in self.all_files:
-            # Check if file is in any of the specified folders
-            for folder in folder_list:
-                if file_path.startswith(folder + '/'):
-                    matching_files.append(file_path)
-                    break
+        # Folders are a single path level, so the index is an exact multi-prefix match;
+        # duplicate folder names are collapsed so each file is returned once
+        matching_files = list(itertools.chain.from_iterable(
+            self._folder_index.get(folder, ()) for folder in dict.fromkeys(folder_list)
+        ))
 
         logger.info(f"Found {len(matching_files)} files in folders: {folder_list}")
         return matching_files
 
+    def _fetch_missing_folders(self, folder_list):
+        """
+        List folders absent from the cached file list directly from GCS
+
+        Args:
+            folder_list: List of folder names requested by the caller
+        """
+        # One C-level set difference instead of a Python membership loop per folder
+        missing = frozenset(folder_list).difference(self._listed_folders)
+        if not missing or not self.bucket:
+            return
+
+        missing = sorted(missing)
+        try:
+            listings = self._list_folders(missing)
+        except Exception as e:
+            logger.error(f"Failed to list folders {missing} from GCS: {e}")
+            return
+
+        added = False
+        for folder, files in zip(missing, listings):
+            for file_path in files:
+                added = self._add_file(file_path) or added
+            self._listed_folders.add(folder)
+            logger.info(f"Fetched {len(files)} files for uncached folder: {folder}")
+
+        # Persist the new files so the next start does not list these folders again
+        if added:
+            self._cache_dirty = True
+            self._maybe_flush()
+
     def generate_signed_url(self, blob_name, expiration_minutes=60):
         """
         Generate a signed URL for streaming a file from GCS
@@ -156,22 +616,60 @@ class GCSMusicManager:
             return None
 
         try:
-            blob = self.bucket.blob(blob_name)
+            # Signing is local (no metadata request), so a cached Blob handle is all it needs
+            blob = self._blobs.get(blob_name)
+            if blob is None:
+                blob = self._blobs[blob_name] = self.bucket.blob(blob_name)
 
             # Generate signed URL
             url = blob.generate_signed_url(
                 version='v4',
                 expiration=timedelta(minutes=expiration_minutes),
-                method='GET'
+                method='GET',
+                credentials=self._signing_credentials
             )
 
-            logger.info(f"Generated signed URL for {blob_name} (expires in {expiration_minutes} min)")
+            logger.info("Generated signed URL for %s (expires in %s min)", blob_name, expiration_minutes)
             return url
 
         except Exception as e:
             logger.error(f"Failed to generate signed URL for {blob_name}: {e}")
             return None
 
+    def generate_signed_urls(self, blob_names, expiration_minutes=60):
+        """
+        Generate signed URLs for several files concurrently
+
+        Args:
+            blob_names: Paths to files in GCS bucket
+            expiration_minutes: URL expiration time in minutes
+
+        Returns:
+            Dict of {blob_name: signed URL or None}
+        """
+        blob_names = list(blob_names)
+        urls = _signing_executor.map(
+            lambda name: self.generate_signed_url(name, expiration_minutes),
+            blob_names
+        )
+        return dict(zip(blob_names, urls))
+
+    async def generate_signed_url_async(self, blob_name, expiration_minutes=60):
+        """
+        Generate a signed URL on the signing pool without blocking the event loop
+
+        Args:
+            blob_name: Path to file in GCS bucket (e.g., 'Fantasy_mp3/Song.mp3')
+            expiration_minutes: URL expiration time in minutes
+
+        Returns:
+            Signed URL string
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _signing_executor, self.generate_signed_url, blob_name, expiration_minutes
+        )
+
     def verify_connection(self):
         """
         Verify GCS connection by checking bucket access
@@ -200,7 +698,8 @@ class GCSMusicManager:
         Returns:
             Number of files
         """
-        return len(self.all_files)
+        self._ensure_files()
+        return len(self._files_set)
 
     def get_folders(self):
         """
@@ -209,20 +708,30 @@ class GCSMusicManager:
         Returns:
             List of folder names
         """
-        folders = set()
-        for file_path in self.all_files:
-            if '/' in file_path:
-                folder = file_path.split('/')[0]
-                folders.add(folder)
-
-        return sorted(list(folders))
+        self._ensure_files()
+        return sorted(self._folder_index.keys())
 
     def refresh(self):
         """
         Manually refresh file list from GCS
         """
+        self._ensure_files()
         self._refresh_file_list()
 
+    def flush(self):
+        """
+        Write the file list cache if it has pending changes
+        """
+        if self._cache_dirty:
+            self._save_cache()
+
+    def _maybe_flush(self):
+        """
+        Write pending cache changes unless the cache was written very recently
+        """
+        if time.time() - self._last_flush > CACHE_FLUSH_INTERVAL_SECONDS:
+            self.flush()
+
     def upload_file(self, local_path, destination_blob_name):
         """
         Upload a file to GCS bucket
@@ -238,15 +747,17 @@ class GCSMusicManager:
             logger.error("GCS bucket not initialized")
             return False
 
+        self._ensure_files()
+
         try:
             blob = self.bucket.blob(destination_blob_name)
             blob.upload_from_filename(local_path)
             logger.info(f"Uploaded {local_path} to {destination_blob_name}")
 
             # Add to file list and refresh cache
-            if destination_blob_name.lower().endswith('.mp3'):
-                self.all_files.append(destination_blob_name)
-                self._save_cache()
+            if destination_blob_name.endswith(_MP3_SUFFIXES) and self._add_file(destination_blob_name):
+                self._cache_dirty = True
+                self._maybe_flush()
 
             return True
 
@@ -268,18 +779,48 @@ class GCSMusicManager:
             logger.error("GCS bucket not initialized")
             return False
 
+        self._ensure_files()
+
         try:
             blob = self.bucket.blob(blob_name)
             blob.delete()
             logger.info(f"Deleted {blob_name} from GCS")
 
             # Remove from file list and refresh cache
-            if blob_name in self.all_files:
-                self.all_files.remove(blob_name)
-                self._save_cache()
+            if self._remove_file(blob_name):
+                self._cache_dirty = True
+                self._maybe_flush()
 
             return True
 
         except Exception as e:
             logger.error(f"Failed to delete {blob_name}: {e}")
             return False
+
+    def upload_files(self, pairs):
+        """
+        Upload several files to GCS bucket and write the cache once at the end
+
+        Args:
+            pairs: Iterable of (local_path, destination_blob_name)
+
+        Returns:
+            List of True/False results in input order
+        """
+        results = [self.upload_file(local_path, blob_name) for local_path, blob_name in pairs]
+        self.flush()
+        return results
+
+    def delete_files(self, blob_names):
+        """
+        Delete several files from GCS bucket and write the cache once at the end
+
+        Args:
+            blob_names: Iterable of paths to files in GCS bucket
+
+        Returns:
+            List of True/False results in input order
+        """
+        results = [self.delete_file(blob_name) for blob_name in blob_names]
+        self.flush()
+        return results
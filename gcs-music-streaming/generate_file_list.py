@@ -4,12 +4,12 @@ Run this script after uploading new files to your GCS bucket
 """
 
 import os
-import json
 import logging
-from google.cloud import storage
-from google.oauth2 import service_account
+from collections import Counter
 from dotenv import load_dotenv
 
+from gcs_utils import get_shared_client, list_mp3_files, load_file_list, save_file_list
+
 # Load environment variables
 load_dotenv()
 
@@ -21,9 +21,28 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def load_previous_files(path):
+    """
+    Load the blob names from an existing cache file
+
+    Returns:
+        Set of blob names, or None if there is no usable cache
+    """
+    if not os.path.exists(path):
+        return None
+
+    try:
+        files, _ = load_file_list(path)
+        return set(files)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+        return None
+
+
 def generate_file_list():
     """
     Fetch all MP3 files from GCS bucket and save to JSON cache
+    The cache file is only rewritten when the set of files changed
     """
     bucket_name = os.getenv('GCS_BUCKET_NAME')
     credentials_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
@@ -40,34 +59,40 @@ def generate_file_list():
     try:
         # Initialize GCS client
         logger.info(f"Connecting to GCS bucket: {bucket_name}")
-        credentials = service_account.Credentials.from_service_account_file(credentials_path)
-        storage_client = storage.Client(credentials=credentials)
+        storage_client = get_shared_client(credentials_path)
         bucket = storage_client.bucket(bucket_name)
 
-        # Fetch all blobs
+        # Fetch MP3 blob names page by page
         logger.info("Fetching file list from GCS...")
-        blobs = bucket.list_blobs()
-
-        # Filter MP3 files
-        mp3_files = []
-        folder_counts = {}
+        mp3_files = list_mp3_files(bucket)
 
-        for blob in blobs:
-            if blob.name.lower().endswith('.mp3'):
-                mp3_files.append(blob.name)
+        # Count files per folder
+        folder_counts = Counter()
 
-                # Count files per folder
-                if '/' in blob.name:
-                    folder = blob.name.split('/')[0]
-                    folder_counts[folder] = folder_counts.get(folder, 0) + 1
+        for name in mp3_files:
+            folder, sep, _ = name.partition('/')
+            if sep:
+                folder_counts[folder] += 1
 
         # Sort files
         mp3_files.sort()
 
-        # Save to JSON
-        logger.info(f"Saving {len(mp3_files)} files to {output_file}")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(mp3_files, f, indent=2, ensure_ascii=False)
+        # Compare against the existing cache and skip the rewrite when nothing changed
+        previous_files = load_previous_files(output_file)
+        current_files = set(mp3_files)
+
+        if previous_files is not None and not previous_files.symmetric_difference(current_files):
+            logger.info(f"File list unchanged, keeping existing {output_file}")
+        else:
+            if previous_files is not None:
+                logger.info(
+                    f"File list changed: {len(current_files - previous_files)} added, "
+                    f"{len(previous_files - current_files)} removed"
+                )
+
+            # Save to JSON
+            logger.info(f"Saving {len(mp3_files)} files to {output_file}")
+            save_file_list(mp3_files, output_file)
 
         # Print summary
         logger.info(f"\n{'='*60}")
@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for production deployments
+Runs the FastAPI app on Uvicorn worker processes (uvloop + httptools)
+"""
+
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8003')}"
+# os.cpu_count() reports the host's CPUs inside a container, so default to a small fixed count;
+# set WORKERS to match the container's CPU limit
+workers = int(os.getenv('WORKERS', 2))
+worker_class = 'uvicorn_worker.UvicornWorker'
+
+# With Uvicorn workers this only restarts a worker whose event loop stops heartbeating
+# (e.g. blocked by sync code); it is not a per-request limit
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
@@ -0,0 +1,147 @@
+"""
+Tiered cache for GPT scene analyses with hit/miss statistics
+"""
+
+import time
+import asyncio
+import logging
+from cachetools import TLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """
+    Caches GPT analyses so repeated or near-duplicate prompts skip the LLM round-trip
+
+    Lookups go through an in-process TTL/LRU cache, then an optional disk tier
+    (diskcache.Cache, shared across workers and restarts), then an optional
+    SemanticCache for prompts whose embeddings are close to a previous prompt.
+    A semantic hit is copied into the exact tiers with the semantic entry's
+    remaining lifetime, so promotion never extends an analysis past its expiry.
+    """
+
+    def __init__(self, max_entries=100, ttl_seconds=86400, disk_cache=None, semantic_cache=None):
+        """
+        Initialize LLM Cache
+
+        Args:
+            max_entries: Maximum entries kept in memory (least recently used are evicted)
+            ttl_seconds: Expiry for exact-match entries
+            disk_cache: Optional diskcache.Cache persisting exact-match entries
+            semantic_cache: Optional SemanticCache for embedding-similarity lookups
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # {prompt_hash: (result, expires_at)}; each entry expires at its own time
+        self.memory = TLRUCache(maxsize=max_entries, ttu=lambda _key, entry, _now: entry[1], timer=time.time)
+        self.disk = disk_cache
+        self.semantic = semantic_cache
+        self.stats = {'hits': 0, 'semantic_hits': 0, 'misses': 0}
+
+    def get(self, key):
+        """
+        Look up an exact-match entry (memory first, then disk)
+
+        Args:
+            key: Prompt hash
+
+        Returns:
+            Cached analysis dict, or None
+        """
+        entry = self.memory.get(key)
+        result = entry[0] if entry is not None else None
+
+        if result is None and self.disk is not None:
+            result, expires_at = self.disk.get(key, expire_time=True)
+            if result is not None:
+                self.memory[key] = (result, expires_at or time.time() + self.ttl_seconds)
+
+        if result is not None:
+            self.stats['hits'] += 1
+            logger.info("GPT cache hit for prompt hash: %s", key)
+        return result
+
+    async def get_similar(self, key, embedding):
+        """
+        Look up the analysis of a semantically similar prompt
+
+        The similarity search runs on a worker thread so it never stalls the
+        event loop. A hit is also stored under the exact key so the next
+        identical prompt skips the embedding call.
+
+        Args:
+            key: Prompt hash
+            embedding: Prompt embedding
+
+        Returns:
+            Cached analysis dict, or None
+        """
+        if self.semantic is None or embedding is None:
+            return None
+
+        hit = await asyncio.to_thread(self.semantic.lookup, embedding)
+        if hit is None:
+            return None
+
+        result, expires_at = hit
+        self.stats['semantic_hits'] += 1
+        self._set_exact(key, result, expires_at)
+        return result
+
+    def record_miss(self):
+        """
+        Count a lookup that had to go to GPT
+        """
+        self.stats['misses'] += 1
+
+    def set(self, key, result, embedding=None):
+        """
+        Cache an analysis under its prompt hash and, if given, its embedding
+
+        Args:
+            key: Prompt hash
+            result: Analysis dict
+            embedding: Prompt embedding for the semantic tier
+        """
+        self._set_exact(key, result)
+        if self.semantic is not None and embedding is not None:
+            self.semantic.add(embedding, result)
+
+    def _set_exact(self, key, result, expires_at=None):
+        """
+        Store an exact-match entry in memory and on disk, expiring at expires_at
+        (default: ttl_seconds from now)
+        """
+        now = time.time()
+        expires_at = expires_at or now + self.ttl_seconds
+        if expires_at <= now:
+            return
+        self.memory[key] = (result, expires_at)
+        if self.disk is not None:
+            self.disk.set(key, result, expire=expires_at - now)
+        logger.info("Cached GPT response for prompt hash: %s", key)
+
+    def clear(self):
+        """
+        Remove all cached entries and reset statistics
+
+        Returns:
+            Dict of entries removed per tier
+        """
+        cleared = {
+            'gpt_cache': len(self.memory),
+            'semantic_cache': len(self.semantic) if self.semantic is not None else 0
+        }
+
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+        if self.semantic is not None:
+            self.semantic.clear()
+        self.stats = dict.fromkeys(self.stats, 0)
+
+        return cleared
+
+    def __len__(self):
+        return len(self.memory)
@@ -11,21 +11,31 @@ Improvements:
 """
 
 import os
-import json
+import sys
+import re
+import orjson
+import asyncio
 import logging
 import random
-import hashlib
+import itertools
 import time
-from typing import Dict, List, Optional, Deque
-from collections import deque
+import hashlib
+import unicodedata
+import diskcache
+import numpy as np
+import ahocorasick
+from typing import Callable, Dict, List, Optional, Deque, Tuple, NamedTuple
+from collections import defaultdict, deque
+from cachetools import TTLCache
 from datetime import datetime, timedelta
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from openai import OpenAI
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from dotenv import load_dotenv
 
 from gcs_utils import GCSMusicManager
+from semantic_cache import SemanticCache
+from llm_cache import LLMCache
 from models import (
     AnalyzeRequest,
     AnalyzeResponse,
@@ -46,30 +56,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Environment configuration (read once at import, never per request)
+CORS_ORIGINS = tuple(o.strip() for o in os.getenv('CORS_ORIGINS', '*').split(',') if o.strip())
+GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', '')
+HOST = os.getenv('HOST', '0.0.0.0')
+PORT = int(os.getenv('PORT', 8003))
+
 # Initialize FastAPI app
 app = FastAPI(
     title="GCS Music Streaming Service",
     description="AI-powered music recommendation with Google Cloud Storage streaming",
-    version="3.1-Enhanced"
+    version="3.1-Enhanced",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=os.getenv('CORS_ORIGINS', '*').split(','),
+    allow_origins=list(CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Initialize OpenAI client
-openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+# OpenAI client, created on first GPT/embedding call (see get_openai)
+_openai_client = None
 
-# Initialize GCS Manager
-gcs_manager = GCSMusicManager(
-    bucket_name=os.getenv('GCS_BUCKET_NAME'),
-    credentials_path=os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
-)
+
+def get_openai():
+    """
+    Return the shared AsyncOpenAI client, importing and creating it on first use
+
+    The openai package is only imported when a prompt actually needs GPT, so
+    startup (and keyword-bypassed requests) never pay for it.
+    """
+    global _openai_client
+    if _openai_client is None:
+        from openai import AsyncOpenAI
+        _openai_client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    return _openai_client
 
 # Music Library - Maps moods to genre folders and keywords
 MUSIC_LIBRARY = {
@@ -151,6 +176,25 @@ MUSIC_LIBRARY = {
     }
 }
 
+# /api/moods body, serialized once since MUSIC_LIBRARY never changes at runtime
+MOODS_JSON = orjson.dumps({
+    mood: {'keywords': info['keywords'], 'folders': info['folders']}
+    for mood, info in MUSIC_LIBRARY.items()
+})
+# Strong validator for conditional GETs on /api/moods (the payload only changes on deploy)
+MOODS_ETAG = f'"{hashlib.blake2b(MOODS_JSON, digest_size=16).hexdigest()}"'
+MOODS_CACHE_CONTROL = 'public, max-age=300'
+
+# Unique GCS folders referenced by MUSIC_LIBRARY (only these are listed from the bucket)
+MUSIC_FOLDERS = sorted({folder for info in MUSIC_LIBRARY.values() for folder in info['folders']})
+
+# Initialize GCS Manager
+gcs_manager = GCSMusicManager(
+    bucket_name=GCS_BUCKET_NAME or None,
+    credentials_path=os.getenv('GOOGLE_APPLICATION_CREDENTIALS'),
+    folders=MUSIC_FOLDERS
+)
+
 # Mood similarity mapping (for fallback when no files found)
 MOOD_SIMILARITY = {
     'peaceful': ['nostalgic', 'isolation', 'romantic'],
@@ -174,98 +218,251 @@ MOOD_SIMILARITY = {
     'dark_comedy': ['comedy', 'horror', 'suspense']
 }
 
-# Cache configuration
-GPT_CACHE_MAX_SIZE = 100
-GPT_CACHE_EXPIRY_HOURS = 24
-URL_CACHE_EXPIRY_MINUTES = 50  # Regenerate before 60-min expiration
-RECENT_TRACKS_SIZE = 10  # Number of recent tracks to avoid
+# Keywords that override GPT's mood selection in post_process_mood
+OVERRIDE_KEYWORDS = {
+    'mysterious': ['호기심', '궁금', '신비'],
+    'curious': ['호기심', '궁금한'],
+    'suspense': ['긴장', '긴장감'],
+    'horror': ['두려움', '공포', '무서운', '섬뜩']
+}
 
-# Global caches
-gpt_cache: Dict[str, Dict] = {}  # {prompt_hash: {result: dict, timestamp: float}}
-url_cache: Dict[str, Dict] = {}  # {blob_name: {url: str, timestamp: float}}
-recent_tracks: Deque[str] = deque(maxlen=RECENT_TRACKS_SIZE)
 
+def build_keyword_index() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Invert OVERRIDE_KEYWORDS and MUSIC_LIBRARY into a keyword -> moods index
 
-def get_prompt_hash(prompt: str) -> str:
-    """Generate hash for prompt caching"""
-    return hashlib.md5(prompt.encode('utf-8')).hexdigest()
+    Returns:
+        Dict mapping each keyword to a tuple of (source, mood) pairs, where
+        source is 'override' or 'library'
+    """
+    keyword_moods: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    for mood, keywords in OVERRIDE_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_moods[keyword].append(('override', mood))
+    for mood, info in MUSIC_LIBRARY.items():
+        for keyword in info['keywords']:
+            keyword_moods[keyword].append(('library', mood))
+    return {keyword: tuple(moods) for keyword, moods in keyword_moods.items()}
 
 
-def get_cached_gpt_response(prompt: str) -> Optional[Dict]:
-    """Retrieve cached GPT response if available and not expired"""
-    prompt_hash = get_prompt_hash(prompt)
+KEYWORD_TO_MOODS = build_keyword_index()
 
-    if prompt_hash not in gpt_cache:
-        return None
 
-    cached = gpt_cache[prompt_hash]
-    age_hours = (time.time() - cached['timestamp']) / 3600
+def build_keyword_automaton() -> ahocorasick.Automaton:
+    """
+    Build one Aho-Corasick automaton over the KEYWORD_TO_MOODS keywords
+
+    Each match yields (keyword, (source, mood) pairs), so a single scan of the
+    prompt serves both post_process_mood and the keyword bypass tier.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword, moods in KEYWORD_TO_MOODS.items():
+        automaton.add_word(keyword, (keyword, moods))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = build_keyword_automaton()
+
+# GPT configuration (part of the exact cache key and the semantic cache namespace, so changing
+# either never serves analyses made with the old settings from any tier)
+GPT_MODEL = "gpt-4o-mini"  # Faster and cheaper than gpt-3.5-turbo for short JSON answers, and eligible for prompt caching
+GPT_TEMPERATURE = 0.7
+GPT_MAX_TOKENS = 200  # Caps the free-text reasoning field, which dominates output length
+GPT_STREAM = os.getenv('GPT_STREAM', 'false').lower() == 'true'  # Start music selection once primary_mood streams in
+# Skip GPT when MUSIC_LIBRARY keywords alone point to one mood (off by default: the lists are GPT hints)
+KEYWORD_BYPASS = os.getenv('KEYWORD_BYPASS', 'false').lower() == 'true'
+KEYWORD_BYPASS_MIN_HITS = 2  # Distinct keywords for that mood required before the bypass trusts them
+
+# Semantic cache configuration (embedding similarity tier between exact cache and GPT)
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIM = 1536
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_MAX_SIZE = 10000
+SEMANTIC_CACHE_DIR = os.getenv('SEMANTIC_CACHE_DIR', '.semantic_cache')
 
-    if age_hours > GPT_CACHE_EXPIRY_HOURS:
-        # Expired, remove from cache
-        del gpt_cache[prompt_hash]
-        logger.info(f"GPT cache expired for prompt hash: {prompt_hash}")
+# Cache configuration
+GPT_CACHE_MAX_SIZE = 10000
+GPT_CACHE_EXPIRY_HOURS = 1
+URL_CACHE_MAX_SIZE = 10000
+URL_CACHE_EXPIRY_MINUTES = 50  # Idle expiry, slid forward on each hit
+URL_MAX_AGE_MINUTES = 55  # Hard cap since signing, below GCS's 60-min URL lifetime
+URL_REFRESH_INTERVAL_SECONDS = 60  # How often the background refresher checks hot tracks
+URL_REFRESH_MARGIN_MINUTES = 5  # Re-sign hot tracks this long before URL_MAX_AGE_MINUTES
+RECENT_TRACKS_SIZE = 5  # Number of recent tracks to avoid, per mood
+RECENT_TRACKS_MAX_DRAWS = 20  # Random draws before falling back to filtering out recent tracks
+MOOD_FILES_REFRESH_MINUTES = 10  # Relist GCS in the background and rebuild the mood index if files changed
+CACHE_DIR = os.getenv('CACHE_DIR', '.cache')  # Persistent GPT/URL cache tier (empty = in-memory only)
+
+
+class URLEntry(NamedTuple):
+    """Cached signed URL"""
+    url: str
+    issued_at: float  # Signing time, never updated (the TTLCache timer provides the sliding expiry)
+
+
+def open_disk_cache(name: str, **settings) -> Optional[diskcache.Cache]:
+    """Open a persistent cache tier under CACHE_DIR (None when persistence is disabled)"""
+    if not CACHE_DIR:
         return None
+    return diskcache.Cache(os.path.join(CACHE_DIR, name), **settings)
 
-    logger.info(f"GPT cache hit for prompt hash: {prompt_hash} (age: {age_hours:.2f}h)")
-    return cached['result']
 
+# Global caches (TTL + LRU eviction in O(1))
+url_cache: TTLCache = TTLCache(maxsize=URL_CACHE_MAX_SIZE, ttl=URL_CACHE_EXPIRY_MINUTES * 60)  # {blob_name: URLEntry}
+# Disk tier behind the in-process URL cache, shared across workers and restarts
+url_disk_cache = open_disk_cache('url', eviction_policy='least-recently-used')
+recent_per_mood: Dict[str, Deque[str]] = defaultdict(lambda: deque(maxlen=RECENT_TRACKS_SIZE))
+recent_set_per_mood: Dict[str, set] = defaultdict(set)  # Mirrors recent_per_mood for O(1) membership checks
+signing_in_flight: Dict[str, asyncio.Task] = {}  # {blob_name: signing task} shared by concurrent cache misses
 
-def cache_gpt_response(prompt: str, result: Dict):
-    """Cache GPT response with timestamp"""
-    prompt_hash = get_prompt_hash(prompt)
 
-    # LRU eviction if cache is full
-    if len(gpt_cache) >= GPT_CACHE_MAX_SIZE:
-        # Remove oldest entry
-        oldest_key = min(gpt_cache.keys(), key=lambda k: gpt_cache[k]['timestamp'])
-        del gpt_cache[oldest_key]
-        logger.info(f"GPT cache full, evicted oldest entry")
+class MoodIndex(NamedTuple):
+    """Structure-of-arrays mood -> files table"""
+    names: List[str]  # file id -> blob name
+    basenames: Dict[str, str]  # blob name -> file name shown in responses
+    ids: np.ndarray  # int32 file ids, grouped by mood
+    cum_weights: np.ndarray  # float64 running sum of per-entry selection weights, aligned with ids
+    slices: Dict[str, Tuple[int, int]]  # mood -> (lo, hi) range into ids, similar-mood fallback applied
+    sources: Dict[str, str]  # mood -> mood whose files it actually serves
+    generation: int  # gcs_manager.generation the index was built from
 
-    gpt_cache[prompt_hash] = {
-        'result': result,
-        'timestamp': time.time()
-    }
-    logger.info(f"Cached GPT response for prompt hash: {prompt_hash}")
+
+# Precomputed mood index, rebuilt at startup and periodically (swapped as one object, never mutated)
+MOOD_INDEX: Optional[MoodIndex] = None
+# Track selection RNG; module-level so tests can seed it (_rng.seed(...)) for repeatable picks
+_rng = random.Random()
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Canonicalize prompt so whitespace/case/unicode-form variants share a cache entry"""
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFKC', prompt).strip().lower())
+
+
+def get_prompt_hash(prompt: str) -> str:
+    """Generate hash for prompt caching (non-cryptographic use, BLAKE2b is faster than MD5)"""
+    key_material = f"{GPT_MODEL}|{GPT_TEMPERATURE}|{SYSTEM_PROMPT_DIGEST}|{normalize_prompt(prompt)}"
+    return hashlib.blake2b(key_material.encode('utf-8'), digest_size=16).hexdigest()
 
 
 def get_cached_signed_url(blob_name: str) -> Optional[str]:
-    """Retrieve cached signed URL if available and not expired"""
-    if blob_name not in url_cache:
+    """
+    Retrieve cached signed URL if available and not expired (memory first, then disk)
+    Hits slide the idle expiry forward, but never past URL_MAX_AGE_MINUTES after signing
+    """
+    entry = url_cache.get(blob_name)
+    if entry is None and url_disk_cache is not None:
+        # Stored as a plain tuple so entries do not depend on the module name at unpickling
+        stored = url_disk_cache.get(blob_name)
+        if isinstance(stored, tuple):
+            entry = url_cache[blob_name] = URLEntry._make(stored)
+    if entry is None:
         return None
 
-    cached = url_cache[blob_name]
-    age_minutes = (time.time() - cached['timestamp']) / 60
-
-    if age_minutes > URL_CACHE_EXPIRY_MINUTES:
-        # Expired, remove from cache
-        del url_cache[blob_name]
-        logger.info(f"URL cache expired for: {blob_name}")
+    issued_age = time.time() - entry.issued_at
+    if issued_age > URL_MAX_AGE_MINUTES * 60:
+        url_cache.pop(blob_name, None)
+        if url_disk_cache is not None:
+            url_disk_cache.delete(blob_name)
         return None
 
-    logger.info(f"URL cache hit for: {blob_name} (age: {age_minutes:.2f}m)")
-    return cached['url']
+    if issued_age < (URL_MAX_AGE_MINUTES - URL_CACHE_EXPIRY_MINUTES) * 60:
+        # Re-inserting restarts the TTLCache timer (sliding expiry)
+        url_cache[blob_name] = entry
+
+    logger.info("URL cache hit for: %s", blob_name)
+    return entry.url
 
 
 def cache_signed_url(blob_name: str, url: str):
-    """Cache signed URL with timestamp"""
-    url_cache[blob_name] = {
-        'url': url,
-        'timestamp': time.time()
-    }
-    logger.info(f"Cached signed URL for: {blob_name}")
+    """Cache signed URL (idle expiry handled by TTLCache, hard cap by issued_at)"""
+    entry = URLEntry(url, time.time())
+    url_cache[blob_name] = entry
+    if url_disk_cache is not None:
+        url_disk_cache.set(blob_name, tuple(entry), expire=URL_MAX_AGE_MINUTES * 60)
+    logger.info("Cached signed URL for: %s", blob_name)
+
+
+async def sign_and_cache_url(blob_name: str) -> Optional[str]:
+    """Sign a URL on the signing pool and cache it"""
+    url = await gcs_manager.generate_signed_url_async(blob_name)
+    if url:
+        cache_signed_url(blob_name, url)
+    return url
 
 
-def analyze_scene_with_gpt(prompt: str, retry_count: int = 3) -> Dict:
+async def get_signed_url(blob_name: str) -> Optional[str]:
     """
-    Analyze scene description using GPT-3.5 with caching and retry
+    Get a signed URL from the cache, or sign it once for all concurrent requests
+
+    Concurrent misses for the same blob await one signing task instead of
+    each signing the URL again.
     """
-    # Check cache first
-    cached_result = get_cached_gpt_response(prompt)
-    if cached_result:
-        return cached_result
+    cached_url = get_cached_signed_url(blob_name)
+    if cached_url:
+        return cached_url
+
+    task = signing_in_flight.get(blob_name)
+    if task is None:
+        task = asyncio.create_task(sign_and_cache_url(blob_name))
+        signing_in_flight[blob_name] = task
+        task.add_done_callback(lambda _: signing_in_flight.pop(blob_name, None))
+    # Shielded so a cancelled request does not cancel signing for the others
+    return await asyncio.shield(task)
+
+
+async def presign_hot_tracks():
+    """
+    Re-sign recently selected tracks whose cached URL is missing or close to its hard cap
+    """
+    refresh_age = (URL_MAX_AGE_MINUTES - URL_REFRESH_MARGIN_MINUTES) * 60
+    now = time.time()
+    stale = []
+    for blob_name in dict.fromkeys(itertools.chain.from_iterable(recent_per_mood.values())):
+        # One lookup: an entry can expire between a membership check and indexing
+        entry = url_cache.get(blob_name)
+        if entry is None or now - entry.issued_at > refresh_age:
+            stale.append(blob_name)
+    if not stale:
+        return
+
+    urls = await asyncio.to_thread(gcs_manager.generate_signed_urls, stale)
+    for blob_name, url in urls.items():
+        if url:
+            cache_signed_url(blob_name, url)
+    logger.info(f"Pre-signed {len(stale)} hot track URLs")
+
+
+async def refresh_signed_urls_periodically():
+    """
+    Keep hot track URLs warm in the background so /api/analyze rarely signs inline
+    """
+    while True:
+        try:
+            await presign_hot_tracks()
+        except Exception as e:
+            logger.error(f"Failed to pre-sign hot track URLs: {e}")
+        await asyncio.sleep(URL_REFRESH_INTERVAL_SECONDS)
+
+
+async def embed_prompt(prompt: str) -> Optional[List[float]]:
+    """Embed prompt for the semantic cache; returns None if embedding fails"""
+    try:
+        response = await get_openai().embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=normalize_prompt(prompt)
+        )
+        return response.data[0].embedding
+    except Exception as e:
+        logger.warning(f"Prompt embedding failed, skipping semantic cache: {e}")
+        return None
+
 
-    system_prompt = """당신은 게임 스토리 분석 전문가입니다.
+# Byte-identical across calls and sent first, so OpenAI's automatic prompt caching reuses the prefix
+SYSTEM_PROMPT = """당신은 게임 스토리 분석 전문가입니다.
 주어진 에피소드나 씬 설명을 분석하여 적합한 배경음악의 무드를 추천해주세요.
 
 사용 가능한 무드:
@@ -302,36 +499,153 @@ JSON 형식으로 응답해주세요:
   "emotional_tags": ["감정태그들"],
   "reasoning": "선택 이유 설명"
 }"""
+# Part of the GPT cache key, so editing the prompt never serves analyses made with the old one
+SYSTEM_PROMPT_DIGEST = hashlib.blake2b(SYSTEM_PROMPT.encode('utf-8'), digest_size=8).hexdigest()
+# Shared by every request (never mutated) so the messages prefix is identical for OpenAI prefix caching
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+# Same key for every request sharing SYSTEM_PROMPT, so they route to the same prefix cache
+_PROMPT_CACHE_KEY = f"bgm-analyze-{SYSTEM_PROMPT_DIGEST}"
+
+# GPT analyses: exact-match (memory, then disk) and semantic tiers. The semantic tier has
+# no prompt-hash key, so its entries are namespaced by what produced them
+llm_cache = LLMCache(
+    max_entries=GPT_CACHE_MAX_SIZE,
+    ttl_seconds=GPT_CACHE_EXPIRY_HOURS * 3600,
+    disk_cache=open_disk_cache('gpt'),
+    semantic_cache=SemanticCache(
+        dim=EMBEDDING_DIM,
+        threshold=SEMANTIC_CACHE_THRESHOLD,
+        max_entries=SEMANTIC_CACHE_MAX_SIZE,
+        cache_dir=SEMANTIC_CACHE_DIR or None,
+        ttl_seconds=GPT_CACHE_EXPIRY_HOURS * 3600,
+        namespace=f"{GPT_MODEL}|{GPT_TEMPERATURE}|{SYSTEM_PROMPT_DIGEST}|{EMBEDDING_MODEL}"
+    )
+)
+
+_PRIMARY_MOOD_FIELD = re.compile(r'"primary_mood"\s*:\s*"([^"]*)"')
+
+
+def get_gpt_seed(prompt: str) -> int:
+    """Derive a stable sampling seed from the normalized prompt"""
+    digest = hashlib.blake2b(normalize_prompt(prompt).encode('utf-8'), digest_size=4).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def log_prompt_cache_usage(usage):
+    """Log how many prompt tokens OpenAI served from its prompt cache"""
+    details = getattr(usage, 'prompt_tokens_details', None) if usage else None
+    cached_tokens = getattr(details, 'cached_tokens', None) if details else None
+    if cached_tokens is not None:
+        logger.info("GPT prompt cache: %s/%s prompt tokens cached", cached_tokens, usage.prompt_tokens)
+
+
+async def stream_gpt_content(request_args: Dict,
+                             on_mood: Optional[Callable[[str], None]] = None) -> Tuple[str, Optional[str]]:
+    """
+    Stream a GPT completion and return the full content
+
+    Args:
+        request_args: Arguments for chat.completions.create
+        on_mood: Called with primary_mood as soon as that field is complete
+
+    Returns:
+        (completion content (JSON string), finish_reason)
+    """
+    parts = []
+    finish_reason = None
+    mood_reported = on_mood is None
+    stream = await get_openai().chat.completions.create(
+        **request_args, stream=True, stream_options={"include_usage": True}
+    )
+
+    async for chunk in stream:
+        if chunk.usage:
+            log_prompt_cache_usage(chunk.usage)
+        if not chunk.choices:
+            continue
+        finish_reason = chunk.choices[0].finish_reason or finish_reason
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
+        if not mood_reported:
+            match = _PRIMARY_MOOD_FIELD.search(''.join(parts))
+            if match:
+                mood_reported = True
+                on_mood(match.group(1))
+
+    return ''.join(parts), finish_reason
+
+
+async def analyze_scene_with_gpt(prompt: str, retry_count: int = 3,
+                                 on_mood: Optional[Callable[[str], None]] = None) -> Dict:
+    """
+    Analyze scene description using GPT-4o mini with caching and retry
+    Lookup order: exact prompt cache -> semantic (embedding) cache -> GPT
+    With GPT_STREAM, on_mood receives primary_mood before the rest of the response arrives
+    (possibly once per attempt; callers that start work from it must dedupe)
+    """
+    # Check cache first
+    prompt_hash = get_prompt_hash(prompt)
+    cached_result = llm_cache.get(prompt_hash)
+    if cached_result:
+        return cached_result
+
+    # Semantically similar prompt already analyzed
+    embedding = await embed_prompt(prompt)
+    similar_result = await llm_cache.get_similar(prompt_hash, embedding)
+    if similar_result:
+        return similar_result
+
+    llm_cache.record_miss()
+
+    # Built once and reused across retries (retries drop the seed so they can sample differently)
+    request_args = dict(
+        model=GPT_MODEL,
+        messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
+        response_format={"type": "json_object"},
+        temperature=GPT_TEMPERATURE,
+        max_tokens=GPT_MAX_TOKENS,
+        seed=get_gpt_seed(prompt),
+        extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY}
+    )
 
     # Retry logic
     last_error = None
     for attempt in range(retry_count):
+        truncated = False
         try:
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.7
-            )
-
-            analysis = json.loads(response.choices[0].message.content)
-            logger.info(f"GPT Analysis (attempt {attempt + 1}): {analysis}")
+            if attempt:
+                request_args.pop('seed', None)
+            if GPT_STREAM:
+                content, finish_reason = await stream_gpt_content(request_args, on_mood)
+            else:
+                response = await get_openai().chat.completions.create(**request_args)
+                log_prompt_cache_usage(response.usage)
+                content, finish_reason = response.choices[0].message.content, response.choices[0].finish_reason
+
+            if finish_reason == 'length':
+                truncated = True
+                raise ValueError(f"response truncated at max_tokens={GPT_MAX_TOKENS}")
+
+            analysis = orjson.loads(content)
+            logger.info("GPT analysis (attempt %d): mood=%s", attempt + 1, analysis.get('primary_mood'))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Full GPT analysis: %s", analysis)
 
             # Cache the result
-            cache_gpt_response(prompt, analysis)
+            llm_cache.set(prompt_hash, analysis, embedding)
 
             return analysis
 
         except Exception as e:
             last_error = e
             logger.warning(f"GPT analysis attempt {attempt + 1} failed: {e}")
-            if attempt < retry_count - 1:
+            # Truncation is not a rate limit or outage, so retry it immediately
+            if attempt < retry_count - 1 and not truncated:
                 wait_time = (attempt + 1) * 2  # Exponential backoff: 2s, 4s, 6s
                 logger.info(f"Retrying in {wait_time}s...")
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
 
     # All retries failed, return default
     logger.error(f"GPT analysis failed after {retry_count} attempts: {last_error}")
@@ -344,38 +658,200 @@ JSON 형식으로 응답해주세요:
     }
 
 
-def post_process_mood(analysis: Dict, original_prompt: str) -> Dict:
+def match_keywords(prompt: str) -> Dict[str, Dict[str, str]]:
     """
-    Post-process mood selection to fix common GPT misclassifications
+    Scan prompt once with KEYWORD_AUTOMATON
+
+    Args:
+        prompt: Scene description
+
+    Returns:
+        {source: {mood: first matched keyword}} for the 'override' and 'library' keyword sets,
+        plus 'library_keywords': {mood: distinct library keywords matched, nested ones counted once}
+    """
+    found = {'override': {}, 'library': {}, 'library_keywords': {}}
+    for _, (keyword, moods) in KEYWORD_AUTOMATON.iter(prompt.lower()):
+        for source, mood in moods:
+            found[source].setdefault(mood, keyword)
+            if source == 'library':
+                keywords = found['library_keywords'].setdefault(mood, [])
+                # '사랑' inside '사랑하는' is one hit, not two
+                if not any(keyword in other or other in keyword for other in keywords):
+                    keywords.append(keyword)
+    return found
+
+
+def analyze_scene_with_keywords(prompt: str, matches: Optional[Dict] = None) -> Optional[Dict]:
+    """
+    Keyword bypass tier ahead of GPT
+    Returns an analysis when keywords already decide the mood, otherwise None:
+    - a horror override keyword without a mysterious/curious one (post_process_mood
+      would force horror whatever GPT answered)
+    - with KEYWORD_BYPASS, MUSIC_LIBRARY keywords pointing to exactly one mood with at least
+      KEYWORD_BYPASS_MIN_HITS distinct keywords (the lists are GPT hints, so one substring is not enough)
     """
-    prompt_lower = original_prompt.lower()
+    matches = matches or match_keywords(prompt)
+    override = matches['override']
+    library = matches['library']
+    if 'horror' in override and 'mysterious' not in override and 'curious' not in override:
+        mood, keyword = 'horror', override['horror']
+    elif (KEYWORD_BYPASS and len(library) == 1
+          and len(matches['library_keywords'][next(iter(library))]) >= KEYWORD_BYPASS_MIN_HITS):
+        mood, keyword = next(iter(library.items()))
+    else:
+        return None
 
-    # Keywords that should override GPT's mood selection
-    mood_keywords = {
-        'mysterious': ['호기심', '궁금', '신비'],
-        'curious': ['호기심', '궁금한'],
-        'suspense': ['긴장', '긴장감'],
-        'horror': ['두려움', '공포', '무서운', '섬뜩']
+    logger.info("Keyword bypass: selected mood %s (found keyword: %s)", mood, keyword)
+    return {
+        "primary_mood": mood,
+        "secondary_mood": None,
+        "intensity": 0.7,
+        "emotional_tags": [keyword],
+        "reasoning": f"키워드 '{keyword}' 매칭으로 무드 선택"
     }
 
-    for mood, keywords in mood_keywords.items():
-        for keyword in keywords:
-            if keyword in prompt_lower:
-                if mood == 'horror' and analysis['primary_mood'] != 'horror':
-                    # Only override to horror if explicitly horror-related
-                    if any(k in prompt_lower for k in ['두려움', '공포', '무서운', '섬뜩']):
-                        logger.info(f"Post-processing: Overriding mood to {mood} (found keyword: {keyword})")
-                        analysis['primary_mood'] = mood
-                        return analysis
-                elif mood in ['mysterious', 'curious'] and analysis['primary_mood'] == 'horror':
-                    # Prevent horror when it should be mysterious/curious
-                    logger.info(f"Post-processing: Overriding mood to {mood} (found keyword: {keyword})")
-                    analysis['primary_mood'] = mood
-                    return analysis
+
+def post_process_mood(analysis: Dict, original_prompt: str, matches: Optional[Dict] = None) -> Dict:
+    """
+    Post-process mood selection to fix common GPT misclassifications
+    matches may carry a match_keywords() result for the prompt to skip rescanning it
+    """
+    found = (matches or match_keywords(original_prompt))['override']
+
+    if analysis['primary_mood'] == 'horror':
+        # Prevent horror when it should be mysterious/curious
+        for mood in ('mysterious', 'curious'):
+            if mood in found:
+                logger.info("Post-processing: Overriding mood to %s (found keyword: %s)", mood, found[mood])
+                analysis['primary_mood'] = mood
+                return analysis
+    elif 'horror' in found:
+        # Only override to horror if explicitly horror-related
+        logger.info("Post-processing: Overriding mood to horror (found keyword: %s)", found['horror'])
+        analysis['primary_mood'] = 'horror'
 
     return analysis
 
 
+def build_mood_files():
+    """
+    Precompute the files for every mood so requests never scan folders
+
+    Each folder is listed from the manager's index once and each blob name is
+    stored once in names; moods are contiguous (lo, hi) ranges of file ids,
+    so a pick is one binary search over cum_weights plus two index lookups.
+    """
+    global MOOD_INDEX
+
+    generation = gcs_manager.generation
+    names: List[str] = []
+
+    # Each unique folder is resolved once into a contiguous id range; folders are
+    # path prefixes, so every file belongs to exactly one folder
+    folder_ids: Dict[str, np.ndarray] = {}
+    for folder in MUSIC_FOLDERS:
+        files = gcs_manager.get_files_from_folders([folder])
+        folder_ids[folder] = np.arange(len(names), len(names) + len(files), dtype=np.int32)
+        names.extend(files)
+
+    # Moods concatenate their folders' id ranges
+    mood_ids: List[np.ndarray] = []
+    slices: Dict[str, Tuple[int, int]] = {}
+    offset = 0
+    for mood, info in MUSIC_LIBRARY.items():
+        mood_ids.extend(folder_ids[folder] for folder in dict.fromkeys(info['folders']))
+        count = sum(len(folder_ids[folder]) for folder in dict.fromkeys(info['folders']))
+        slices[mood] = (offset, offset + count)
+        offset += count
+    ids = np.concatenate(mood_ids) if mood_ids else np.empty(0, dtype=np.int32)
+    # Uniform for now; per-file weights (e.g. popularity) only need to change this array
+    cum_weights = np.cumsum(np.ones(len(ids), dtype=np.float64))
+
+    # Moods without files borrow the range of their first similar mood that has files,
+    # so selection never walks MOOD_SIMILARITY at request time
+    sources = {mood: mood for mood in slices}
+    own_slices = dict(slices)
+    for mood, (lo, hi) in own_slices.items():
+        if lo != hi:
+            continue
+        for similar_mood in MOOD_SIMILARITY.get(mood, []):
+            similar_lo, similar_hi = own_slices[similar_mood]
+            if similar_lo != similar_hi:
+                slices[mood] = (similar_lo, similar_hi)
+                sources[mood] = similar_mood
+                break
+
+    basenames = {name: name.rpartition('/')[2] for name in names}
+
+    MOOD_INDEX = MoodIndex(names, basenames, ids, cum_weights, slices, sources, generation)
+    logger.info(f"Built mood index: {len(ids)} entries ({len(names)} unique files) for {len(slices)} moods")
+
+
+async def refresh_mood_files_periodically():
+    """
+    Relist GCS in the background so requests never block on a listing
+
+    The new file list and mood index are swapped in whole; the index is only
+    rebuilt when the manager's generation shows the files actually changed.
+    """
+    while True:
+        await asyncio.sleep(MOOD_FILES_REFRESH_MINUTES * 60)
+        try:
+            await asyncio.to_thread(gcs_manager.refresh)
+            if MOOD_INDEX is None or MOOD_INDEX.generation != gcs_manager.generation:
+                await asyncio.to_thread(build_mood_files)
+        except Exception as e:
+            logger.error(f"Failed to refresh GCS file list: {e}")
+
+
+def remember_track(mood: str, track: str):
+    """Add a track to the mood's recent tracks, keeping its membership set in sync"""
+    recent_tracks = recent_per_mood[mood]
+    recent_tracks_set = recent_set_per_mood[mood]
+    evicted = recent_tracks[0] if len(recent_tracks) == recent_tracks.maxlen else None
+    recent_tracks.append(track)
+    recent_tracks_set.add(track)
+
+    if evicted is not None and evicted not in recent_tracks:
+        recent_tracks_set.discard(evicted)
+
+
+def basename_of(blob_name: str) -> str:
+    """File name of a blob, from the mood index when it has it"""
+    basename = MOOD_INDEX.basenames.get(blob_name) if MOOD_INDEX is not None else None
+    return basename or blob_name.rpartition('/')[2]
+
+
+def pick_position(index: MoodIndex, lo: int, hi: int) -> int:
+    """
+    Draw a weighted random position in ids[lo:hi] by binary search over cum_weights
+    """
+    cum_weights = index.cum_weights
+    base = cum_weights[lo - 1] if lo else 0.0
+    target = base + _rng.random() * (cum_weights[hi - 1] - base)
+    return min(int(cum_weights.searchsorted(target, side='right')), hi - 1)
+
+
+def pick_avoiding_recent(index: MoodIndex, lo: int, hi: int, recent_tracks_set: set) -> str:
+    """
+    Pick a random file in ids[lo:hi] not in recent_tracks_set
+
+    Rejection sampling avoids building a filtered list on the common path;
+    the filtered list is only built if every draw hits a recent track.
+    """
+    names, ids = index.names, index.ids
+    for _ in range(RECENT_TRACKS_MAX_DRAWS):
+        candidate = names[ids[pick_position(index, lo, hi)]]
+        if candidate not in recent_tracks_set:
+            return candidate
+
+    available_files = [names[i] for i in ids[lo:hi] if names[i] not in recent_tracks_set]
+    if available_files:
+        logger.info("Filtered out %d recent tracks, %d available", len(recent_tracks_set), len(available_files))
+        return available_files[_rng.randrange(len(available_files))]
+    return names[ids[pick_position(index, lo, hi)]]
+
+
 def select_music_from_mood(mood: str, avoid_duplicates: bool = True) -> str:
     """
     Select a random music file from folders associated with the given mood
@@ -385,46 +861,54 @@ def select_music_from_mood(mood: str, avoid_duplicates: bool = True) -> str:
         logger.warning(f"Mood '{mood}' not found in library, using 'peaceful'")
         mood = 'peaceful'
 
-    mood_info = MUSIC_LIBRARY[mood]
-    folders = mood_info['folders']
-
-    # Get all files from the specified folders
-    all_files = gcs_manager.get_files_from_folders(folders)
-
-    if not all_files:
-        # Try similar moods as fallback
-        logger.warning(f"No files found for mood '{mood}', trying similar moods")
-        similar_moods = MOOD_SIMILARITY.get(mood, [])
+    if MOOD_INDEX is None:
+        build_mood_files()
+    index = MOOD_INDEX
 
-        for similar_mood in similar_moods:
-            similar_folders = MUSIC_LIBRARY[similar_mood]['folders']
-            all_files = gcs_manager.get_files_from_folders(similar_folders)
-            if all_files:
-                logger.info(f"Using similar mood '{similar_mood}' instead of '{mood}'")
-                mood = similar_mood
-                break
+    # Get the mood's file id range from the precomputed index (similar-mood fallback already applied)
+    lo, hi = index.slices[mood]
 
-        if not all_files:
-            logger.error(f"No files found for mood '{mood}' or similar moods")
-            raise HTTPException(status_code=404, detail=f"No music files found for mood '{mood}'")
+    if lo == hi:
+        logger.error(f"No files found for mood '{mood}' or similar moods")
+        raise HTTPException(status_code=404, detail=f"No music files found for mood '{mood}'")
 
-    # Filter out recently played tracks
-    if avoid_duplicates and len(all_files) > RECENT_TRACKS_SIZE:
-        available_files = [f for f in all_files if f not in recent_tracks]
-        if available_files:
-            all_files = available_files
-            logger.info(f"Filtered out {len(recent_tracks)} recent tracks, {len(all_files)} available")
+    if index.sources[mood] != mood:
+        logger.info("Using similar mood '%s' instead of '%s'", index.sources[mood], mood)
+        mood = index.sources[mood]
 
-    # Select random file
-    selected_file = random.choice(all_files)
+    # Select random file, avoiding tracks recently played for this mood
+    recent_tracks_set = recent_set_per_mood[mood]
+    if not avoid_duplicates or not recent_tracks_set or hi - lo <= RECENT_TRACKS_SIZE:
+        selected_file = index.names[index.ids[pick_position(index, lo, hi)]]
+    else:
+        selected_file = pick_avoiding_recent(index, lo, hi, recent_tracks_set)
 
     # Add to recent tracks
-    recent_tracks.append(selected_file)
+    remember_track(mood, selected_file)
 
-    logger.info(f"Selected file: {selected_file} for mood '{mood}'")
+    logger.info("Selected file: %s for mood '%s'", selected_file, mood)
     return selected_file
 
 
+async def prepare_music(mood: str) -> Tuple[str, str]:
+    """
+    Select a music file for the mood and get its streaming URL
+
+    Returns:
+        (selected_file, streaming_url)
+    """
+    # Select music file (with duplicate prevention)
+    selected_file = select_music_from_mood(mood)
+
+    # Generate signed URL (with caching)
+    streaming_url = await get_signed_url(selected_file)
+
+    if not streaming_url:
+        raise HTTPException(status_code=500, detail="Failed to generate streaming URL")
+
+    return selected_file, streaming_url
+
+
 @app.post("/api/analyze", response_model=AnalyzeResponse, responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}})
 async def analyze(request: AnalyzeRequest):
     """
@@ -432,42 +916,52 @@ async def analyze(request: AnalyzeRequest):
     """
     try:
         prompt = request.prompt
-        logger.info(f"Received prompt: {prompt}")
+        logger.info("Received prompt: %s", prompt)
 
-        # Step 1: Analyze with GPT (with caching and retry)
-        analysis_dict = analyze_scene_with_gpt(prompt)
+        # One keyword automaton pass serves the bypass tier and post-processing
+        matches = match_keywords(prompt)
 
-        # Step 2: Post-process mood
-        analysis_dict = post_process_mood(analysis_dict, prompt)
+        # Music preparation started from a streamed primary_mood, keyed by post-processed mood
+        early_music: Dict[str, asyncio.Task] = {}
 
-        # Step 3: Select music file (with duplicate prevention)
-        mood = analysis_dict['primary_mood']
-        selected_file = select_music_from_mood(mood)
+        def start_music(gpt_mood: str):
+            # Only the first streamed mood starts work; a retried attempt must not orphan that task
+            if early_music:
+                return
+            mood = post_process_mood({'primary_mood': gpt_mood}, prompt, matches)['primary_mood']
+            early_music[mood] = asyncio.create_task(prepare_music(mood))
 
-        # Step 4: Generate signed URL (with caching)
-        cached_url = get_cached_signed_url(selected_file)
-        if cached_url:
-            streaming_url = cached_url
-        else:
-            streaming_url = gcs_manager.generate_signed_url(selected_file)
-            if streaming_url:
-                cache_signed_url(selected_file, streaming_url)
+        # Step 1: Analyze with keywords, falling back to GPT (with caching and retry)
+        analysis_dict = (
+            analyze_scene_with_keywords(prompt, matches)
+            or await analyze_scene_with_gpt(prompt, on_mood=start_music)
+        )
+
+        # Step 2: Post-process mood
+        analysis_dict = post_process_mood(analysis_dict, prompt, matches)
 
-        if not streaming_url:
-            raise HTTPException(status_code=500, detail="Failed to generate streaming URL")
+        # Step 3: Select music file and generate signed URL, reusing the early start if the mood held
+        mood = analysis_dict['primary_mood']
+        early_task = early_music.pop(mood, None)
+        for task in early_music.values():
+            task.cancel()
+        selected_file, streaming_url = await (early_task or prepare_music(mood))
 
-        # Step 5: Prepare response
+        # Step 4: Prepare response
         analysis = MusicAnalysis(**analysis_dict)
         music = MusicInfo(
             mood=mood,
-            filename=os.path.basename(selected_file),
+            filename=basename_of(selected_file),
             file_path=selected_file,
             streaming_url=streaming_url
         )
 
         response = AnalyzeResponse(analysis=analysis, music=music)
-        logger.info(f"Response prepared successfully")
-        return response
+        logger.info("Response prepared: mood=%s file=%s", mood, music.filename)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full response: %s", response)
+        # Serialized in pydantic-core directly; returning the model would re-validate it against response_model
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except HTTPException:
         raise
@@ -477,17 +971,24 @@ async def analyze(request: AnalyzeRequest):
 
 
 @app.get("/api/moods", response_model=Dict[str, MoodInfo])
-async def get_moods():
+async def get_moods(if_none_match: Optional[str] = Header(None)):
     """
     List all available moods and their mapped folders
+    Answers 304 Not Modified when the client already has the current payload
     """
-    moods_info = {}
-    for mood, info in MUSIC_LIBRARY.items():
-        moods_info[mood] = MoodInfo(
-            keywords=info['keywords'],
-            folders=info['folders']
-        )
-    return moods_info
+    headers = {'ETag': MOODS_ETAG, 'Cache-Control': MOODS_CACHE_CONTROL}
+    # If-None-Match uses weak comparison (RFC 9110), so W/ tags match the strong ETag too
+    if if_none_match and {'*', MOODS_ETAG} & {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}:
+        return Response(status_code=304, headers=headers)
+    return Response(content=MOODS_JSON, media_type="application/json", headers=headers)
+
+
+# /api/health body up to total_files; only total_files and llm_cache change at runtime
+HEALTH_JSON_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "version": "3.1-Enhanced",
+    "gcs_bucket": GCS_BUCKET_NAME
+})[:-1] + b',"total_files":'
 
 
 @app.get("/api/health", response_model=HealthResponse)
@@ -495,12 +996,11 @@ async def health():
     """
     Health check endpoint with cache statistics
     """
-    return HealthResponse(
-        status="healthy",
-        version="3.1-Enhanced",
-        gcs_bucket=os.getenv('GCS_BUCKET_NAME', ''),
-        total_files=len(gcs_manager.all_files)
+    body = (
+        HEALTH_JSON_PREFIX + str(gcs_manager.get_file_count()).encode()
+        + b',"llm_cache":' + orjson.dumps(llm_cache.stats) + b'}'
     )
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/cache/stats")
@@ -510,18 +1010,28 @@ async def cache_stats():
     """
     return {
         "gpt_cache": {
-            "size": len(gpt_cache),
+            "size": len(llm_cache),
             "max_size": GPT_CACHE_MAX_SIZE,
-            "expiry_hours": GPT_CACHE_EXPIRY_HOURS
+            "expiry_hours": GPT_CACHE_EXPIRY_HOURS,
+            "disk_size": len(llm_cache.disk) if llm_cache.disk is not None else 0,
+            **llm_cache.stats
+        },
+        "semantic_cache": {
+            "size": len(llm_cache.semantic),
+            "max_size": SEMANTIC_CACHE_MAX_SIZE,
+            "threshold": SEMANTIC_CACHE_THRESHOLD
         },
         "url_cache": {
             "size": len(url_cache),
-            "expiry_minutes": URL_CACHE_EXPIRY_MINUTES
+            "max_size": URL_CACHE_MAX_SIZE,
+            "expiry_minutes": URL_CACHE_EXPIRY_MINUTES,
+            "max_age_minutes": URL_MAX_AGE_MINUTES,
+            "disk_size": len(url_disk_cache) if url_disk_cache is not None else 0
         },
         "recent_tracks": {
-            "size": len(recent_tracks),
-            "max_size": RECENT_TRACKS_SIZE,
-            "tracks": list(recent_tracks)
+            "size": sum(map(len, recent_per_mood.values())),
+            "max_size_per_mood": RECENT_TRACKS_SIZE,
+            "tracks": {mood: list(tracks) for mood, tracks in recent_per_mood.items()}
         }
     }
 
@@ -531,22 +1041,22 @@ async def clear_cache():
     """
     Clear all caches
     """
-    global gpt_cache, url_cache, recent_tracks
-
-    gpt_cache_size = len(gpt_cache)
     url_cache_size = len(url_cache)
-    tracks_size = len(recent_tracks)
+    tracks_size = sum(map(len, recent_per_mood.values()))
 
-    gpt_cache = {}
-    url_cache = {}
-    recent_tracks = deque(maxlen=RECENT_TRACKS_SIZE)
+    llm_cleared = llm_cache.clear()
+    url_cache.clear()
+    if url_disk_cache is not None:
+        url_disk_cache.clear()
+    recent_per_mood.clear()
+    recent_set_per_mood.clear()
 
     logger.info("All caches cleared")
 
     return {
         "message": "All caches cleared",
         "cleared": {
-            "gpt_cache": gpt_cache_size,
+            **llm_cleared,
             "url_cache": url_cache_size,
             "recent_tracks": tracks_size
         }
@@ -566,23 +1076,36 @@ async def startup_event():
     """
     Run on application startup
     """
-    # Verify GCS connection
-    if gcs_manager.verify_connection():
+    # Verify GCS connection (blocking GCS/file I/O runs off the event loop)
+    if await asyncio.to_thread(gcs_manager.verify_connection):
         logger.info("GCS connection verified successfully")
-        logger.info(f"Total files loaded: {len(gcs_manager.all_files)}")
+        logger.info(f"Total files loaded: {await asyncio.to_thread(gcs_manager.get_file_count)}")
     else:
         logger.error("GCS connection failed! Check your credentials and bucket name.")
 
+    # Precompute mood -> files and keep it in sync with file list refreshes
+    await asyncio.to_thread(build_mood_files)
+    asyncio.create_task(refresh_mood_files_periodically())
+    asyncio.create_task(refresh_signed_urls_periodically())
+
     logger.info("FastAPI Music Streaming Service started successfully")
     logger.info(f"Version: 3.1-Enhanced with caching and improvements")
-    logger.info(f"Documentation available at http://localhost:{os.getenv('PORT', 8003)}/docs")
+    logger.info(f"Documentation available at http://localhost:{PORT}/docs")
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    host = os.getenv('HOST', '0.0.0.0')
-    port = int(os.getenv('PORT', 8003))
-
-    logger.info(f"Starting FastAPI Music Streaming Service on {host}:{port}")
-    uvicorn.run(app, host=host, port=port)
+    workers = int(os.getenv('WORKERS', 2))  # cpu_count() is the host's count in a container
+
+    logger.info(f"Starting FastAPI Music Streaming Service on {HOST}:{PORT} with {workers} workers")
+    # Worker processes need an import string; in-memory caches are per worker (disk tiers are shared)
+    uvicorn.run(
+        "main:app",
+        host=HOST,
+        port=PORT,
+        workers=workers,
+        loop='asyncio' if sys.platform == 'win32' else 'uvloop',  # uvloop has no Windows build
+        http='httptools',
+        proxy_headers=True
+    )
@@ -2,17 +2,21 @@
 Pydantic models for Music Streaming API
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, List, Optional
 
 
 class AnalyzeRequest(BaseModel):
     """Request model for /api/analyze endpoint"""
+    model_config = ConfigDict(frozen=True)
+
     prompt: str = Field(..., min_length=1, description="Scene description to analyze")
 
 
 class MusicAnalysis(BaseModel):
     """GPT analysis result"""
+    model_config = ConfigDict(frozen=True)
+
     primary_mood: str = Field(..., description="Primary mood detected")
     secondary_mood: Optional[str] = Field(None, description="Secondary mood if any")
     intensity: float = Field(..., ge=0.0, le=1.0, description="Intensity level 0.0-1.0")
@@ -22,6 +26,8 @@ class MusicAnalysis(BaseModel):
 
 class MusicInfo(BaseModel):
     """Music file information"""
+    model_config = ConfigDict(frozen=True)
+
     mood: str = Field(..., description="Selected mood")
     filename: str = Field(..., description="Music filename")
     file_path: str = Field(..., description="Full path in GCS")
@@ -30,24 +36,33 @@ class MusicInfo(BaseModel):
 
 class AnalyzeResponse(BaseModel):
     """Response model for /api/analyze endpoint"""
+    model_config = ConfigDict(frozen=True)
+
     analysis: MusicAnalysis
     music: MusicInfo
 
 
 class MoodInfo(BaseModel):
     """Mood configuration information"""
+    model_config = ConfigDict(frozen=True)
+
     keywords: List[str] = Field(..., description="Korean keywords for this mood")
     folders: List[str] = Field(..., description="GCS folders associated with this mood")
 
 
 class HealthResponse(BaseModel):
     """Response model for /api/health endpoint"""
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="Service version")
     gcs_bucket: str = Field(..., description="GCS bucket name")
     total_files: int = Field(..., description="Total number of music files")
+    llm_cache: Dict[str, int] = Field(default_factory=dict, description="GPT cache hit/miss counters")
 
 
 class ErrorResponse(BaseModel):
     """Error response model"""
+    model_config = ConfigDict(frozen=True)
+
     error: str = Field(..., description="Error message")
@@ -4,6 +4,7 @@ Production-ready server for Music Streaming Service
 """
 
 import os
+import sys
 import uvicorn
 from dotenv import load_dotenv
 
@@ -13,11 +14,12 @@ load_dotenv()
 if __name__ == '__main__':
     host = os.getenv('HOST', '0.0.0.0')
     port = int(os.getenv('PORT', 8003))
+    workers = int(os.getenv('WORKERS', 2))  # cpu_count() is the host's count in a container
 
     print("=" * 60)
     print("FastAPI Music Streaming Service")
     print("=" * 60)
-    print(f"Server running on http://{host}:{port}")
+    print(f"Server running on http://{host}:{port} ({workers} workers)")
     print(f"API Documentation: http://{host}:{port}/docs")
     print(f"Alternative Docs: http://{host}:{port}/redoc")
     print("Press Ctrl+C to stop")
@@ -29,6 +31,9 @@ if __name__ == '__main__':
         host=host,
         port=port,
         reload=False,  # Set to True for development
-        workers=1,     # Increase for production
+        workers=workers,
+        loop='asyncio' if sys.platform == 'win32' else 'uvloop',  # uvloop has no Windows build
+        http='httptools',
+        proxy_headers=True,
         log_level="info"
     )
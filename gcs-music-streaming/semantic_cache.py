@@ -0,0 +1,358 @@
+"""
+Semantic (embedding similarity) cache for GPT scene analyses
+"""
+
+import os
+import json
+import time
+import atexit
+import tempfile
+import logging
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single-process use only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# The append-only results log is compacted once it holds this many times max_entries lines
+LOG_COMPACT_FACTOR = 2
+
+# Process umask, read once at import (os.umask can only be read by setting it, which races threads)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Compactions rewrite the whole log, so they run off the caller's (event loop) thread
+_compact_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='semantic-compact')
+
+
+class SemanticCache:
+    """
+    Returns a cached analysis for prompts whose embeddings are close to a previous prompt
+
+    Embeddings are stored L2-normalized as float32 rows, so a lookup is one
+    BLAS matrix-vector product followed by an argmax. Lookups are meant to run
+    on a worker thread; a lock keeps them consistent with concurrent adds.
+    When a directory is given the matrix lives in a numpy.memmap and each add
+    appends one line to a JSONL results log (compacted in the background), so
+    the cache survives restarts without rewriting it per insert. Every slot
+    carries an expiry time, and persisted entries are only reloaded for the
+    same namespace (model/system prompt).
+    """
+
+    def __init__(self, dim=1536, threshold=0.92, max_entries=1000, cache_dir=None,
+                 ttl_seconds=3600, namespace=''):
+        """
+        Initialize Semantic Cache
+
+        Args:
+            dim: Embedding dimension (1536 for text-embedding-3-small)
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum cached prompts; an expired or else the least recently used entry is overwritten when full
+            cache_dir: Directory for persisted embeddings/results (None keeps it in memory)
+            ttl_seconds: Expiry for each entry, counted from when it was added
+            namespace: Identifies what produced the analyses (e.g. model and prompt digest);
+                persisted entries from another namespace are discarded on load
+        """
+        self.dim = dim
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self.results = []
+        self.expires = np.zeros(max_entries, dtype=np.float64)  # Slot -> expiry (epoch seconds)
+        self.last_used = np.zeros(max_entries, dtype=np.float64)  # Slot -> last hit or insert, for LRU eviction
+        self._lock_file = None
+        self._lock = threading.Lock()
+
+        # Append-only results log state (persistent mode only)
+        self._log = None
+        self._log_path = None
+        self._log_lines = 0
+        self._log_epoch = 0  # Bumped by clear() so an in-flight compaction is discarded
+        self._compacting = False
+        self._pending_lines = []  # Lines appended while a compaction is writing its snapshot
+
+        if cache_dir and self._acquire_dir_lock():
+            self._open_persistent()
+            atexit.register(self.flush)
+        else:
+            self.cache_dir = None
+            self.vectors = np.zeros((max_entries, dim), dtype=np.float32)
+
+    def _acquire_dir_lock(self):
+        """
+        Take an exclusive lock on the cache directory
+
+        Slots are assigned per process, so two workers sharing one memmap would
+        overwrite each other's rows. Only the first worker persists; the others
+        fall back to an in-memory cache.
+
+        Returns:
+            True if this process owns the directory
+        """
+        if fcntl is None:
+            return True
+        os.makedirs(self.cache_dir, exist_ok=True)
+        lock_file = open(os.path.join(self.cache_dir, '.lock'), 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            logger.info(f"Semantic cache {self.cache_dir} is used by another worker, keeping this one in memory")
+            return False
+        self._lock_file = lock_file
+        return True
+
+    def _open_persistent(self):
+        """
+        Open (or create) the memory-mapped embedding matrix and replay its results log
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        vectors_path = os.path.join(self.cache_dir, 'embeddings.f32')
+        self._log_path = os.path.join(self.cache_dir, 'results.jsonl')
+        shape = (self.max_entries, self.dim)
+        expected_size = self.max_entries * self.dim * np.dtype(np.float32).itemsize
+
+        if os.path.exists(vectors_path) and os.path.getsize(vectors_path) == expected_size:
+            self.vectors = np.memmap(vectors_path, dtype=np.float32, mode='r+', shape=shape)
+            self._replay_log()
+        else:
+            self.vectors = np.memmap(vectors_path, dtype=np.float32, mode='w+', shape=shape)
+
+        # Start from a compact log holding exactly the live entries
+        self._replace_log(self._write_log(self._snapshot()))
+
+    def _replay_log(self):
+        """
+        Restore results and slot expiries from the results log
+        """
+        if not os.path.exists(self._log_path):
+            return
+        try:
+            with open(self._log_path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or '{}')
+                if header.get('namespace') != self.namespace:
+                    logger.info(f"Discarding semantic cache entries from another model/prompt in {self.cache_dir}")
+                    return
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # Torn last line from an interrupted write
+                    slot = entry['slot']
+                    if slot == len(self.results):
+                        self.results.append(entry['result'])
+                    elif slot < len(self.results):
+                        self.results[slot] = entry['result']
+                    else:
+                        continue
+                    self.expires[slot] = entry['expires']
+        except Exception as e:
+            logger.warning(f"Failed to load semantic cache results: {e}")
+            self.results = []
+            self.expires[:] = 0
+
+        count = len(self.results)
+        # Insertion time stands in for recency after a restart
+        self.last_used[:count] = self.expires[:count] - self.ttl_seconds
+        logger.info(f"Loaded {count} semantic cache entries from {self.cache_dir}")
+
+    @staticmethod
+    def _log_line(slot, expires, result):
+        """
+        Serialize one results log entry
+        """
+        return json.dumps({'slot': slot, 'expires': expires, 'result': result}, ensure_ascii=False) + '\n'
+
+    def _snapshot(self):
+        """
+        Log lines for every live slot (call with the lock held, or before other threads use the cache)
+        """
+        return [
+            self._log_line(slot, float(self.expires[slot]), result)
+            for slot, result in enumerate(self.results)
+        ]
+
+    def _write_log(self, lines):
+        """
+        Write a header plus the given lines to a new temp file next to the log
+
+        Returns:
+            Path of the temp file
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='results.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'namespace': self.namespace}) + '\n')
+                f.writelines(lines)
+            # mkstemp creates 0600 files and os.replace keeps that mode, so match the log being replaced
+            try:
+                mode = os.stat(self._log_path).st_mode & 0o7777
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(tmp_path, mode)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return tmp_path
+
+    def _replace_log(self, tmp_path, extra_lines=()):
+        """
+        Swap a written temp file in as the results log and reopen it for appending
+        (call with the lock held once other threads use the cache)
+        """
+        if extra_lines:
+            with open(tmp_path, 'a', encoding='utf-8') as f:
+                f.writelines(extra_lines)
+        os.replace(tmp_path, self._log_path)
+        if self._log is not None:
+            self._log.close()
+        self._log = open(self._log_path, 'a', encoding='utf-8')
+        self._log_lines = len(self.results) + len(extra_lines)
+
+    def _compact(self):
+        """
+        Rewrite the results log with only the live entries (runs on _compact_executor)
+        """
+        try:
+            with self._lock:
+                epoch = self._log_epoch
+                lines = self._snapshot()
+                self._pending_lines = []
+
+            # The O(N) write happens without the lock, so adds and lookups carry on
+            self.vectors.flush()
+            tmp_path = self._write_log(lines)
+
+            with self._lock:
+                if epoch != self._log_epoch:
+                    os.unlink(tmp_path)
+                    return
+                self._replace_log(tmp_path, self._pending_lines)
+        except Exception as e:
+            logger.error(f"Failed to compact semantic cache log: {e}")
+        finally:
+            with self._lock:
+                self._compacting = False
+                self._pending_lines = []
+
+    def flush(self):
+        """
+        Flush embeddings and buffered log lines to disk
+        """
+        if not self.cache_dir:
+            return
+        with self._lock:
+            self.vectors.flush()
+            if self._log is not None:
+                self._log.flush()
+
+    @staticmethod
+    def _normalize(embedding):
+        """
+        Convert an embedding to a unit-length float32 vector
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding):
+        """
+        Find the cached analysis most similar to the given embedding
+
+        Args:
+            embedding: Prompt embedding
+
+        Returns:
+            (copy of the cached analysis dict, expiry in epoch seconds), or None if
+            no unexpired entry is similar enough
+        """
+        now = time.time()
+        query = self._normalize(embedding)
+        with self._lock:
+            count = len(self.results)
+            if not count:
+                return None
+
+            similarities = self.vectors[:count] @ query
+            similarities[self.expires[:count] <= now] = -np.inf
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+
+            if similarity < self.threshold:
+                return None
+
+            self.last_used[best] = now
+            hit = dict(self.results[best]), float(self.expires[best])
+
+        logger.info("Semantic cache hit (similarity: %.3f)", similarity)
+        return hit
+
+    def add(self, embedding, result):
+        """
+        Cache an analysis under the given prompt embedding
+
+        Persisting costs one appended log line; rewriting the log is left to a
+        background compaction.
+
+        Args:
+            embedding: Prompt embedding
+            result: Analysis dict to return on similar prompts
+        """
+        now = time.time()
+        vector = self._normalize(embedding)
+        result = dict(result)
+        with self._lock:
+            count = len(self.results)
+            if count < self.max_entries:
+                slot = count
+                self.results.append(result)
+            else:
+                expired = self.expires <= now
+                slot = int(np.argmax(expired)) if expired.any() else int(np.argmin(self.last_used))
+                self.results[slot] = result
+
+            self.vectors[slot] = vector
+            self.expires[slot] = now + self.ttl_seconds
+            self.last_used[slot] = now
+
+            if self._log is None:
+                return
+            try:
+                line = self._log_line(slot, now + self.ttl_seconds, result)
+                self._log.write(line)
+                self._log.flush()
+            except Exception as e:
+                logger.error(f"Failed to append to semantic cache log: {e}")
+                return
+            self._log_lines += 1
+            if self._compacting:
+                self._pending_lines.append(line)
+            elif self._log_lines > LOG_COMPACT_FACTOR * self.max_entries:
+                self._compacting = True
+                _compact_executor.submit(self._compact)
+
+    def clear(self):
+        """
+        Remove all cached entries
+        """
+        with self._lock:
+            self.results = []
+            self.expires[:] = 0
+            self.last_used[:] = 0
+            if self._log is None:
+                return
+            self._log_epoch += 1
+            try:
+                self._replace_log(self._write_log([]))
+            except Exception as e:
+                logger.error(f"Failed to clear semantic cache log: {e}")
+
+    def __len__(self):
+        return len(self.results)
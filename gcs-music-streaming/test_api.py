@@ -2,11 +2,15 @@
 Test the Music Streaming API endpoints
 """
 
-import requests
+import httpx
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 API_BASE_URL = 'http://localhost:8003'
 
+# One pooled keep-alive client for the whole suite (httpx ships with openai)
+client = httpx.Client(base_url=API_BASE_URL, timeout=30.0)
+
 
 def print_section(title):
     """Print a section header"""
@@ -20,7 +24,7 @@ def test_health():
     print_section("Testing Health Endpoint")
 
     try:
-        response = requests.get(f'{API_BASE_URL}/api/health')
+        response = client.get('/api/health')
         print(f"Status Code: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
         return response.status_code == 200
@@ -34,7 +38,7 @@ def test_moods():
     print_section("Testing Moods Endpoint")
 
     try:
-        response = requests.get(f'{API_BASE_URL}/api/moods')
+        response = client.get('/api/moods')
         print(f"Status Code: {response.status_code}")
         data = response.json()
         print(f"Total moods: {len(data)}")
@@ -47,16 +51,23 @@ def test_moods():
         return False
 
 
-def test_analyze(prompt):
-    """Test analyze endpoint"""
+def post_analyze(prompt):
+    """Send an analyze request, returning the response or the raised exception"""
+    try:
+        return client.post('/api/analyze', json={'prompt': prompt})
+    except Exception as e:
+        return e
+
+
+def test_analyze(prompt, response=None):
+    """Test analyze endpoint (response may be prefetched by post_analyze)"""
     print_section(f"Testing Analyze Endpoint: '{prompt}'")
 
     try:
-        response = requests.post(
-            f'{API_BASE_URL}/api/analyze',
-            json={'prompt': prompt},
-            headers={'Content-Type': 'application/json'}
-        )
+        if response is None:
+            response = post_analyze(prompt)
+        if isinstance(response, Exception):
+            raise response
 
         print(f"Status Code: {response.status_code}")
 
@@ -114,8 +125,12 @@ def main():
         "오래된 저택에서 이상한 소리가 들리고 두려움을 느낀다"
     ]
 
-    for i, prompt in enumerate(test_prompts, 1):
-        results.append((f"Analyze Test {i}", test_analyze(prompt)))
+    # The prompts are independent, so send them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=len(test_prompts)) as executor:
+        responses = list(executor.map(post_analyze, test_prompts))
+
+    for i, (prompt, response) in enumerate(zip(test_prompts, responses), 1):
+        results.append((f"Analyze Test {i}", test_analyze(prompt, response)))
 
     # Print summary
     print_section("Test Summary")
@@ -4,10 +4,10 @@ Test GCS connection and verify bucket access
 
 import os
 import logging
-from google.cloud import storage
-from google.oauth2 import service_account
 from dotenv import load_dotenv
 
+from gcs_utils import get_shared_client
+
 # Load environment variables
 load_dotenv()
 
@@ -52,8 +52,7 @@ def test_gcs_connection():
     # Try to connect
     print("\n3. Connecting to GCS...")
     try:
-        credentials = service_account.Credentials.from_service_account_file(credentials_path)
-        storage_client = storage.Client(credentials=credentials)
+        storage_client = get_shared_client(credentials_path)
         bucket = storage_client.bucket(bucket_name)
         bucket.reload()  # Test bucket access
         print(f"   ✅ Successfully connected to bucket: {bucket_name}")